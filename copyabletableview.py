@@ -0,0 +1,106 @@
+#  Copyright (c) 2024 Medical Imaging and Data Resource Center (MIDRC).
+#
+#      Licensed under the Apache License, Version 2.0 (the "License");
+#      you may not use this file except in compliance with the License.
+#      You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#      Unless required by applicable law or agreed to in writing, software
+#      distributed under the License is distributed on an "AS IS" BASIS,
+#      WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#      See the License for the specific language governing permissions and
+#      limitations under the License.
+#
+from collections import defaultdict
+import csv
+import io
+from typing import Iterable
+
+from PySide6.QtCore import QDate, QEvent, QObject, Qt
+from PySide6.QtGui import QGuiApplication, QKeySequence
+from PySide6.QtWidgets import QTableView
+
+
+class CopyableTableView(QTableView):
+    """
+    A custom subclass of QTableView that allows copying selected data to the clipboard.
+
+    Methods:
+        __init__(): Initializes the CopyableTableView object.
+        eventFilter(source, event): Filters and handles key press events.
+        copy_selection(): Copies the selected data to the clipboard.
+
+    """
+    def __init__(self):
+        super().__init__()
+        self.installEventFilter(self)
+
+    def eventFilter(self, source: QObject, event):
+        """
+        Filters and handles key press events.
+
+        Parameters:
+            source (object): The source object that triggered the event.
+            event (QEvent): The event object that contains information about the key press event.
+
+        Returns:
+            bool: True if the event is handled, False otherwise.
+        """
+        if event.type() == QEvent.KeyPress:
+            if event == QKeySequence.Copy:
+                self.copy_selection()
+                return True
+        return super(QTableView, self).eventFilter(source, event)
+
+    def copy_selection(self):
+        """
+        Copies the selected data to the clipboard as a tab-delimited table.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        selection = self.selectedIndexes()
+        if selection:
+            # Only the selected cells are stored, so a sparse selection over a large range does not build a full grid
+            rows = defaultdict(dict)
+            for index in selection:
+                index_data = index.data()
+                if isinstance(index_data, QDate):
+                    index_data = index_data.toString(format=Qt.ISODate)
+                rows[index.row()][index.column()] = '' if index_data is None else str(index_data)
+            col_min = min(min(row) for row in rows.values())
+            col_max = max(max(row) for row in rows.values())
+            empty_row = {}
+            stream = io.StringIO()
+            self._write_tab_delimited_rows(stream, ([rows.get(row, empty_row).get(column, '')
+                                                     for column in range(col_min, col_max + 1)]
+                                                    for row in range(min(rows), max(rows) + 1)))
+            QGuiApplication.clipboard().setText(stream.getvalue())
+
+    @staticmethod
+    def _write_tab_delimited_rows(stream, rows: Iterable[list]):
+        """
+        Write rows of strings to a stream as tab-delimited text in the same format as csv.writer.
+
+        The cells are normally plain numbers and dates, so each row is joined directly. A row with a cell that needs csv
+        quoting is written with csv.writer instead.
+
+        Parameters:
+            stream (io.StringIO): The stream to write the text to.
+            rows (Iterable[list]): The rows to write, each one a list of strings.
+
+        Returns:
+            None
+        """
+        writer = csv.writer(stream, delimiter='\t')
+        for row in rows:
+            line = '\t'.join(row)
+            # A tab inside a cell shows up as an extra separator, and csv.writer quotes a row that is one empty cell
+            if not line or '"' in line or '\n' in line or '\r' in line or line.count('\t') != len(row) - 1:
+                writer.writerow(row)
+            else:
+                stream.write(line + '\r\n')
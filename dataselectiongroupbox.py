@@ -13,7 +13,8 @@
 #      limitations under the License.
 #
 
-from PySide6.QtCore import QSignalBlocker, Signal
+from PySide6.QtCore import QSignalBlocker, Qt, Signal
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import QCheckBox, QComboBox, QFormLayout, QGroupBox, QHBoxLayout, QLabel
 
 
@@ -58,8 +59,11 @@ class JsdDataSelectionGroupBox(QGroupBox):
         self.form_layout = QFormLayout()
         self.file_comboboxes = []
         self.file_checkboxes = []
+        # The file comboboxes all share a single model so that the list of files is only stored once
+        self._file_model = QStandardItemModel(self)
         self.category_label = QLabel('Attribute')
         self.category_combobox = QComboBox()
+        self._category_list = []
         self.set_layout(data_sources)
 
     def set_layout(self, data_sources):
@@ -91,7 +95,7 @@ class JsdDataSelectionGroupBox(QGroupBox):
         self.file_comboboxes[0].setCurrentIndex(0)
         self.file_checkboxes[0].setChecked(True)
 
-        # Now we can copy the data from the first combobox to the rest of them
+        # Now we can add the rest of the comboboxes, which share the list of files with the first one
         self.set_num_data_items(self.NUM_DEFAULT_DATA_ITEMS)
 
     def add_file_combobox_to_layout(self, auto_populate: bool = True):
@@ -99,13 +103,16 @@ class JsdDataSelectionGroupBox(QGroupBox):
         Add a file combobox to the layout.
 
         Parameters:
-        - auto_populate (bool): If True, the combobox will be populated with items from the first combobox.
+        - auto_populate (bool): If True, the combobox will select the next file in the shared list of files.
 
         Returns:
         None
         """
         new_hbox = QHBoxLayout()
         new_combobox = QComboBox()
+        new_combobox.setModel(self._file_model)
+        # All items are single lines of text, so the popup does not need to measure each item separately
+        new_combobox.view().setUniformItemSizes(True)
         new_checkbox = QCheckBox()
         new_hbox.addWidget(new_combobox, stretch=1)
         new_hbox.addWidget(new_checkbox, stretch=0)
@@ -119,9 +126,6 @@ class JsdDataSelectionGroupBox(QGroupBox):
         new_checkbox.toggled.connect(self.file_checkbox_state_changed.emit)
 
         if auto_populate:
-            cbox: QComboBox = self.file_comboboxes[0]
-            for i in range(cbox.count()):
-                new_combobox.addItem(cbox.itemText(i), userData=cbox.itemData(i))
             new_combobox.setCurrentIndex(index - 1)
 
     def remove_file_combobox_from_layout(self):
@@ -163,17 +167,20 @@ class JsdDataSelectionGroupBox(QGroupBox):
         """
         if len(self.file_comboboxes) == count:
             return
+        # Add or remove all the rows before the group box is laid out and repainted
+        self.setUpdatesEnabled(False)
         while len(self.file_comboboxes) < count:
             self.add_file_combobox_to_layout()
         while len(self.file_comboboxes) > count:
             self.remove_file_combobox_from_layout()
+        self.setUpdatesEnabled(True)
         self.num_data_items_changed.emit(count)
 
     def add_file_to_comboboxes(self, description: str, name: str):
         """
         Add a file to the file comboboxes.
 
-        This method adds a file to each of the file comboboxes in the JsdDataSelectionGroupBox.
+        This method adds a file to the model shared by all of the file comboboxes in the JsdDataSelectionGroupBox.
         The file is represented by a description and a name.
         The description is displayed in the combobox as the item text, and the name is stored as the item data.
 
@@ -184,13 +191,14 @@ class JsdDataSelectionGroupBox(QGroupBox):
         Returns:
         None
         """
-        for combobox in self.file_comboboxes:
-            combobox.addItem(description, userData=name)
+        item = QStandardItem(description)
+        item.setData(name, Qt.UserRole)
+        self._file_model.appendRow(item)
 
     def update_category_combo_box(self, categorylist, categoryindex):
         """
         Update the category combo box with the given category list and set the selected index to the specified
-        category index.
+        category index. The items are left in place if the category list has not changed.
 
         Parameters:
         - categorylist (list): The list of categories to populate the combo box.
@@ -200,6 +208,9 @@ class JsdDataSelectionGroupBox(QGroupBox):
         None
         """
         with QSignalBlocker(self.category_combobox):
-            self.category_combobox.clear()
-            self.category_combobox.addItems(categorylist)
+            # The items only need to be replaced if the list of categories has changed
+            if categorylist != self._category_list:
+                self.category_combobox.clear()
+                self.category_combobox.addItems(categorylist)
+                self._category_list = list(categorylist)
             self.category_combobox.setCurrentIndex(categoryindex)
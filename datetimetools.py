@@ -16,6 +16,9 @@ import numpy as np
 import pandas as pd
 from PySide6.QtCore import QDate, QDateTime, QTime, QTimeZone
 
+UNIX_EPOCH_JULIAN_DAY = 2440588
+MILLISECONDS_PER_DAY = 86400000
+
 
 def convert_date_to_milliseconds(date):
     """
@@ -26,6 +29,24 @@ def convert_date_to_milliseconds(date):
     return QDateTime(date, QTime(), QTimeZone.utc()).toMSecsSinceEpoch()
 
 
+def convert_dates_to_milliseconds(dates):
+    """
+    Converts a sequence of dates to milliseconds since epoch.
+
+    Only the Julian day of each date is read, the conversion to milliseconds is then done on the whole array with NumPy
+    instead of creating a QDateTime for every date.
+
+    Parameters:
+        dates (Sequence[QDate]): The dates to convert, a date may be None.
+
+    Returns:
+        np.ndarray: The milliseconds since epoch as floats, with NaN where the date is None.
+    """
+    julian_days = np.fromiter((np.nan if date is None else date.toJulianDay() for date in dates),
+                              dtype=np.float64, count=len(dates))
+    return (julian_days - UNIX_EPOCH_JULIAN_DAY) * MILLISECONDS_PER_DAY
+
+
 def pandas_date_to_qdate(pandas_date):
     """
     Convert a pandas Timestamp or datetime object to a PySide2 QDate object.
@@ -69,3 +90,19 @@ def numpy_datetime64_to_qdate(numpy_datetime):
     day = python_datetime.day
 
     return QDate(year, month, day)
+
+
+def numpy_datetime64_array_to_qdates(numpy_datetimes):
+    """
+    Convert an array of NumPy datetime64 values to a list of PySide2 QDate objects.
+
+    The whole array is converted to Python dates in a single NumPy call instead of converting each element separately.
+
+    Parameters:
+        numpy_datetimes (array-like of numpy.datetime64): NumPy datetime64 values.
+
+    Returns:
+        list[QDate]: PySide2 QDate objects representing the same dates.
+    """
+    python_dates = np.asarray(numpy_datetimes, dtype='M8[D]').astype('O')
+    return [QDate(python_date.year, python_date.month, python_date.day) for python_date in python_dates]
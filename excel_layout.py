@@ -99,6 +99,8 @@ class DataSheet:
                     Initializes a new instance of the DataSheet class.
         create_custom_age_columns(self, age_ranges): Scans the column headers in the age category to build consistent
                                                      age columns.
+        get_column_values(self, columns): Returns the values of the given columns as a read-only float array.
+        dates: The date column as a read-only NumPy datetime64 array.
     """
     def __init__(self, sheet_name, data_source, custom_age_ranges, is_excel=False, file: pd.ExcelFile = None):
         """
@@ -116,6 +118,8 @@ class DataSheet:
         self.name = sheet_name
         self.columns = {}
         self.data_columns = []
+        self._column_values_cache = {}
+        self._dates = None
 
         if is_excel and file is not None:
             self._load_excel_data(file, sheet_name, data_source)
@@ -145,6 +149,40 @@ class DataSheet:
         """Return the dataframe."""
         return self._df
 
+    @property
+    def dates(self):
+        """
+        Return the date column as a NumPy datetime64 array.
+
+        The array is built from the dataframe on first use and then reused, so searches on the dates do not need to go
+        through pandas. It is read-only since it is shared between callers.
+        """
+        if self._dates is None:
+            self._dates = self._df['date'].to_numpy()
+            self._dates.setflags(write=False)
+        return self._dates
+
+    def get_column_values(self, columns):
+        """
+        Returns the values of the given columns as a float array.
+
+        The array is cached for each list of columns, so it is only built from the dataframe once. It is read-only
+        since it is shared between callers.
+
+        Parameters:
+            columns (list): The names of the columns to get, in order.
+
+        Returns:
+            np.ndarray: A 2D array with one row per date and one column per column name.
+        """
+        key = tuple(columns)
+        values = self._column_values_cache.get(key)
+        if values is None:
+            values = self._df[columns].to_numpy(dtype=float)
+            values.setflags(write=False)
+            self._column_values_cache[key] = values
+        return values
+
     def _process_date_column(self, data_source: dict):
         """Process and format the date column."""
 
@@ -192,7 +230,8 @@ class DataSheet:
             - It sums the values of the identified columns for each age range and creates a new custom age column.
             - It checks if all columns have been used and raises a warning if any column is not used.
         """
-        # Drop previously created custom columns
+        # Drop previously created custom columns, along with any cached column values
+        self._column_values_cache.clear()
         cols_to_drop = [col for col in self._df.columns if 'Custom' in col]
         self._df.drop(columns=cols_to_drop, inplace=True)
 
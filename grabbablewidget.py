@@ -1,7 +1,8 @@
+from datetime import datetime
 from typing import Optional
 
 from PySide6.QtCharts import QChart, QChartView
-from PySide6.QtCore import QDateTime, QDir, QEvent, QObject, QStandardPaths, Qt
+from PySide6.QtCore import QDir, QEvent, QObject, QStandardPaths, Qt
 from PySide6.QtGui import QAction, QImage, QPainter
 from PySide6.QtWidgets import (QApplication, QDialog, QFileDialog, QHBoxLayout, QLabel, QLayout, QMenu, QPushButton,
                                QVBoxLayout, QWidget)
@@ -33,7 +34,7 @@ class GrabbableWidgetMixin(QObject):
             Save a high-resolution snapshot of the parent widget to disk.
     """
     DEFAULT_SAVE_FILE_PREFIX = "diversity_plot_"
-    DATE_TIME_FORMAT = "yyyyMMddhhmmss"  # Constant for date-time format
+    DATE_TIME_FORMAT = "%Y%m%d%H%M%S"  # Constant for date-time format
 
     def __init__(self, parent: QWidget = None, save_file_prefix: str = DEFAULT_SAVE_FILE_PREFIX) -> None:
         """
@@ -43,11 +44,15 @@ class GrabbableWidgetMixin(QObject):
         self.save_dialog_open = False  # Indicates if the save dialog is currently open
         super().__init__(parent)
         self.save_file_prefix = save_file_prefix
+        self._filename_template = save_file_prefix + "{timestamp}{suffix}"
         parent.setContextMenuPolicy(Qt.CustomContextMenu)
         parent.customContextMenuRequested.connect(self.show_context_menu)
         parent.installEventFilter(self)
         self.parent = parent
 
+        self._context_menu: Optional[QMenu] = None
+        self._save_high_res_action: Optional[QAction] = None
+
     def eventFilter(self, source, event):
         """
         Filters events for the widget to handle context menu events.
@@ -64,33 +69,45 @@ class GrabbableWidgetMixin(QObject):
             return True
         return super().eventFilter(source, event)
 
-    def show_context_menu(self, pos):
+    def _create_context_menu(self) -> QMenu:
         """
-        Display a context menu for the widget for capturing snapshots of the widget.
-
-        Args:
-            pos: The position where the context menu should be displayed.
+        Create the context menu and its actions. This is only done once, on the first request for the menu.
 
         Returns:
-            None
+            QMenu: The context menu for the widget.
         """
         context_menu = QMenu(self.parent)
         copy_action = QAction("Copy", self.parent)
         save_action = QAction("Save", self.parent)
+        self._save_high_res_action = QAction("Save High Resolution", self.parent)
 
         copy_action.triggered.connect(self.copy_to_clipboard)
         save_action.triggered.connect(self.save_to_disk)
+        self._save_high_res_action.triggered.connect(self.save_high_res_to_disk)
 
         context_menu.addAction(copy_action)
         context_menu.addAction(save_action)
+        context_menu.addAction(self._save_high_res_action)
+
+        return context_menu
+
+    def show_context_menu(self, pos):
+        """
+        Display a context menu for the widget for capturing snapshots of the widget.
+
+        Args:
+            pos: The position where the context menu should be displayed.
+
+        Returns:
+            None
+        """
+        if self._context_menu is None:
+            self._context_menu = self._create_context_menu()
 
         # Only display this action if we don't have the high-res save dialog open for this widget
-        if not self.save_dialog_open:
-            save_high_res_action = QAction("Save High Resolution", self.parent)
-            save_high_res_action.triggered.connect(self.save_high_res_to_disk)
-            context_menu.addAction(save_high_res_action)
+        self._save_high_res_action.setVisible(not self.save_dialog_open)
 
-        context_menu.exec(self.parent.mapToGlobal(pos))
+        self._context_menu.exec(self.parent.mapToGlobal(pos))
 
     def copy_to_clipboard(self):
         """
@@ -101,9 +118,7 @@ class GrabbableWidgetMixin(QObject):
         """
         clipboard = QApplication.clipboard()
         if clipboard is not None:
-            snapshot = self.parent.grab()
-            clipboard.setPixmap(snapshot)
-            del snapshot
+            clipboard.setPixmap(self.parent.grab())
 
     @staticmethod
     def create_directory():
@@ -134,8 +149,9 @@ class GrabbableWidgetMixin(QObject):
         # Get the default save directory
         screenshots_dir = self.create_directory()
 
-        # Set default file name using QDateTime and the constant format
-        default_filename = self.save_file_prefix + QDateTime.currentDateTime().toString(self.DATE_TIME_FORMAT) + suffix
+        # Set default file name using the current time and the constant format
+        default_filename = self._filename_template.format(timestamp=datetime.now().strftime(self.DATE_TIME_FORMAT),
+                                                          suffix=suffix)
         return screenshots_dir.filePath(default_filename)
 
     def save_to_disk(self):
@@ -153,9 +169,7 @@ class GrabbableWidgetMixin(QObject):
                                                    "PNG Files (*.png);;JPEG Files (*.jpg);;All Files (*)",
                                                    options=options)
         if file_name:
-            snapshot = self.parent.grab()
-            snapshot.save(file_name)
-            del snapshot
+            self.parent.grab().save(file_name)
 
     def save_high_res_to_disk(self) -> None:
         """
@@ -268,8 +282,8 @@ class SaveWidgetAsImageDialog(QDialog):
         save_button = QPushButton("Save", self)
         cancel_button = QPushButton("Cancel", self)
 
-        save_button.clicked.connect(self.save_image)
-        cancel_button.clicked.connect(self.cancel_save)
+        save_button.clicked.connect(self.save_image, Qt.DirectConnection)
+        cancel_button.clicked.connect(self.cancel_save, Qt.DirectConnection)
 
         button_layout.addWidget(save_button)
         button_layout.addWidget(cancel_button)
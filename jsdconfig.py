@@ -14,12 +14,16 @@
 #
 
 from dataclasses import dataclass, field
+import os
 
 from yaml import dump, load
 try:
-    from yaml import CLoader as Loader, CDumper as Dumper
+    from yaml import CSafeLoader as Loader, CDumper as Dumper
 except ImportError:
-    from yaml import Loader, Dumper
+    from yaml import SafeLoader as Loader, Dumper
+
+# Parsed YAML data keyed by absolute path and modification time, so an unchanged file is only parsed once per session
+_YAML_CACHE = {}
 
 
 @dataclass
@@ -43,9 +47,16 @@ class JSDConfig:
         self._load_data()
 
     def _load_data(self):
-        """Load the YAML data from the current filename."""
-        with open(self.filename, 'r', encoding='utf-8') as stream:
-            self.data = load(stream, Loader=Loader)
+        """Load the YAML data from the current filename, reusing the parsed data if the file has not changed."""
+        path = os.path.abspath(self.filename)
+        key = (path, os.path.getmtime(path))
+        data = _YAML_CACHE.get(key)
+        if data is None:
+            # The loader reads the bytes directly and detects the encoding itself
+            with open(path, 'rb') as stream:
+                data = load(stream, Loader=Loader)
+            _YAML_CACHE[key] = data
+        self.data = data
         # print(dump(self.data))
 
     def set_filename(self, new_filename: str):
@@ -13,17 +13,42 @@
 #      limitations under the License.
 #
 
-from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import partial
 
 import numpy as np
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 from scipy.spatial import distance
 
-from datetimetools import pandas_date_to_qdate
+from datetimetools import numpy_datetime64_array_to_qdates
 from jsdmodel import JSDTableModel
 from jsdview import JsdWindow
 
 
+@dataclass
+class DataSourceCaches:
+    """
+    Results computed by the JSDController that stay valid until a data source is added.
+
+    Attributes:
+        common_categories (dict): The categories shared by each combination of selected files.
+        cols_to_use (dict): The JSD columns for each data source and category.
+        spider_jsd (dict): The spider chart JSD values for each file pair, category and date.
+
+    Methods:
+        clear(self): Clears all of the caches.
+    """
+    common_categories: dict = field(default_factory=dict)
+    cols_to_use: dict = field(default_factory=dict)
+    spider_jsd: dict = field(default_factory=dict)
+
+    def clear(self):
+        """Clear all of the caches."""
+        self.common_categories.clear()
+        self.cols_to_use.clear()
+        self.spider_jsd.clear()
+
+
 class JSDController(QObject):
     """
     Class JSDController
@@ -40,6 +65,7 @@ class JSDController(QObject):
     modelChanged = Signal()
     fileChangedSignal = Signal()
     NOT_REPORTED_COLUMN_NAME = 'Not reported'
+    FILE_CHANGED_DEBOUNCE_MS = 200
 
     def __init__(self, jsd_view, jsd_model, config):
         """
@@ -61,6 +87,15 @@ class JSDController(QObject):
         self._jsd_model = jsd_model
         self._config = config
 
+        # Rapid changes to the file selection are merged into a single update
+        self._file_changed_timer = QTimer(self)
+        self._file_changed_timer.setSingleShot(True)
+        self._file_changed_timer.setInterval(JSDController.FILE_CHANGED_DEBOUNCE_MS)
+        self._file_changed_timer.timeout.connect(partial(self.file_changed, None))
+        self._last_file_selection = None
+        # Results that depend on the loaded data sources, cleared whenever a data source is added
+        self._caches = DataSourceCaches()
+
         self.initialize()
 
     def initialize(self):
@@ -79,10 +114,11 @@ class JSDController(QObject):
         """
         jsd_view = self.jsd_view  # Store the result of jsd_view() in a variable
         jsd_view.add_data_source.connect(self.jsd_model.add_data_source)
+        self.jsd_model.data_source_added.connect(self._caches.clear)
         for f_c in jsd_view.dataselectiongroupbox.file_comboboxes:
-            f_c.currentIndexChanged.connect(self.file_changed)
-        jsd_view.dataselectiongroupbox.num_data_items_changed.connect(self.file_changed)
-        jsd_view.dataselectiongroupbox.file_checkbox_state_changed.connect(self.file_changed)
+            f_c.currentIndexChanged.connect(self.schedule_file_changed)
+        jsd_view.dataselectiongroupbox.num_data_items_changed.connect(self.schedule_file_changed)
+        jsd_view.dataselectiongroupbox.file_checkbox_state_changed.connect(self.schedule_file_changed)
         jsd_view.dataselectiongroupbox.category_combobox.currentIndexChanged.connect(self.category_changed)
 
         self.fileChangedSignal.connect(self.update_file_based_charts)
@@ -134,30 +170,70 @@ class JSDController(QObject):
             self._jsd_model = jsd_model
             self.modelChanged.emit()
 
+    def schedule_file_changed(self, _=None):
+        """
+        Schedules a call to file_changed, restarting the wait if one is already pending.
+
+        This merges several file selection changes made in quick succession into a single update of the categories
+        and plots.
+        """
+        self._file_changed_timer.start()
+
     def file_changed(self, _, newcategoryindex=None):
         """
         Parses the categories from the files selected in the comboboxes and updates the category box appropriately.
         Emits the fileChangedSignal signal upon completion.
 
+        If the selected files and checkboxes are the same as the last time this was called, and no new category index
+        is given, nothing is updated.
+
         Args:
             newcategoryindex Optional(int): The index of the category to set, if None then use previous index.
+
+        Returns:
+            bool: True if the categories were updated and fileChangedSignal was emitted, False otherwise.
         """
         dataselectiongroupbox = self.jsd_view.dataselectiongroupbox
+        file_selection = tuple((cbox.currentData(), checkbox.isChecked()) for cbox, checkbox in
+                               zip(dataselectiongroupbox.file_comboboxes, dataselectiongroupbox.file_checkboxes))
+        if newcategoryindex is None and file_selection == self._last_file_selection:
+            return False
+        self._last_file_selection = file_selection
+
         category_combobox = dataselectiongroupbox.category_combobox
         categoryindex = category_combobox.currentIndex()
         if newcategoryindex is not None:
             categoryindex = newcategoryindex
 
-        cbox0 = dataselectiongroupbox.file_comboboxes[0]
-        categorylist = self.jsd_model.data_sources[cbox0.currentData()].sheets.keys()
-
-        for cbox2 in dataselectiongroupbox.file_comboboxes[1:]:
-            categorylist2 = self.jsd_model.data_sources[cbox2.currentData()].sheets.keys()
-            categorylist = [value for value in categorylist if value in categorylist2]
-
+        categorylist = self.get_common_categories(tuple(file_name for file_name, _ in file_selection))
         dataselectiongroupbox.update_category_combo_box(categorylist, categoryindex)
 
         self.fileChangedSignal.emit()
+        return True
+
+    def get_common_categories(self, file_names):
+        """
+        Get the categories that are shared by all of the given files.
+
+        The result is cached for each combination of files until a data source is added.
+
+        Args:
+            file_names (tuple): The names of the data sources, in the order of the file comboboxes.
+
+        Returns:
+            list: The common categories, in the sheet order of the first file.
+        """
+        categorylist = self._caches.common_categories.get(file_names)
+        if categorylist is None:
+            data_sources = self.jsd_model.data_sources
+            first_sheets = data_sources[file_names[0]].sheets
+            common_categories = set(first_sheets).intersection(*(data_sources[file_name].sheets.keys()
+                                                                 for file_name in file_names[1:]))
+
+            # Keep the sheet order of the first file
+            categorylist = [category for category in first_sheets if category in common_categories]
+            self._caches.common_categories[file_names] = categorylist
+        return categorylist
 
     def get_file_sheets_from_combobox(self, index=0):
         """
@@ -184,42 +260,46 @@ class JSDController(QObject):
         Returns:
             None
         """
+        # Apply any pending file selection change first, which will call this method again once the categories are
+        # up-to-date
+        if self._file_changed_timer.isActive():
+            self._file_changed_timer.stop()
+            if self.file_changed(None):
+                return
+
         dataselectiongroupbox = self.jsd_view.dataselectiongroupbox
         category = dataselectiongroupbox.category_combobox.currentText()
 
         model_input_data = []
         column_infos = []
 
-        for i, cbox1 in enumerate(dataselectiongroupbox.file_comboboxes[:-1]):
-            file1 = cbox1.currentData()
-            df1 = self.jsd_model.data_sources[file1].sheets[category].df
-            cols_to_use = self.get_cols_to_use_for_jsd_calc(cbox1, category)
-
-            for j, cbox2 in enumerate(dataselectiongroupbox.file_comboboxes[i + 1:], start=i + 1):
-                file2 = cbox2.currentData()
-                df2 = self.jsd_model.data_sources[file2].sheets[category].df
+        # Look up each file's sheet once rather than once per pair of files
+        file_comboboxes = dataselectiongroupbox.file_comboboxes
+        file_names = [cbox.currentData() for cbox in file_comboboxes]
+        sheets = [self.jsd_model.data_sources[file_name].sheets[category] for file_name in file_names]
 
-                first_date = max(df1.date.values[0], df2.date.values[0])
-                date_list = sorted(set(np.concatenate((df1.date.values, df2.date.values))))
-                date_list = remove_elements_less_than_from_sorted_list(date_list, first_date)
+        for i, (file1, sheet1) in enumerate(zip(file_names[:-1], sheets[:-1])):
+            cols_to_use = self.get_cols_to_use_for_jsd_calc(file_comboboxes[i], category)
 
-                input_data = [float(calculate_jsd(df1, df2, cols_to_use, calc_date)) for calc_date in date_list]
+            for j in range(i + 1, len(file_names)):
+                date_list, jsd_values = calculate_jsd_timeline(sheet1, sheets[j], cols_to_use)
 
-                model_input_data.append([pandas_date_to_qdate(calc_date) for calc_date in date_list])
-                model_input_data.append(input_data)
+                model_input_data.append(numpy_datetime64_array_to_qdates(date_list))
+                model_input_data.append(jsd_values.tolist())
 
                 column_infos.append({
                     'category': category,
                     'index1': i,
                     'file1': file1,
                     'index2': j,
-                    'file2': file2,
+                    'file2': file_names[j],
                 })
 
         self.jsd_model.update_input_data(model_input_data, column_infos)
 
+        # The timeline plot sets the colors of the table cells after the model has been reset
         self.update_category_plots()
-        self.jsd_model.layoutChanged.emit()
+        self.jsd_model.notify_color_mapping_changed()
 
     def update_file_based_charts(self):
         """
@@ -276,7 +356,8 @@ class JSDController(QObject):
         """
         Generates a list of columns from a sheet that should be used in the JSD calculation.
 
-        This handles custom categories i.e. for custom age ranges
+        This handles custom categories i.e. for custom age ranges. The result is cached for each data file and
+        category until a data source is added.
 
         Parameters:
             cbox (QComboBox): The combobox used to get the data file from.
@@ -285,13 +366,19 @@ class JSDController(QObject):
         Returns:
             List of columns in the current sheet category
         """
-        cols_to_use = self.jsd_model.data_sources[cbox.currentData()].sheets[category].data_columns
+        file_name = cbox.currentData()
+        cols_to_use = self._caches.cols_to_use.get((file_name, category))
+        if cols_to_use is not None:
+            return cols_to_use
+
+        cols_to_use = self.jsd_model.data_sources[file_name].sheets[category].data_columns
 
         custom_age_ranges = self._config.data.get('custom age ranges', None)
         if custom_age_ranges and category in custom_age_ranges:
             cols_to_use = [f'{age_range[0]}-{age_range[1]} Custom' for
                            age_range in custom_age_ranges[category]] + [JSDController.NOT_REPORTED_COLUMN_NAME]
 
+        self._caches.cols_to_use[(file_name, category)] = cols_to_use
         return cols_to_use
 
     def get_spider_plot_values(self, calc_date=None):
@@ -334,64 +421,111 @@ class JSDController(QObject):
                     cbox0 = dataselectiongroupbox.file_comboboxes[index1]
                     cbox1 = dataselectiongroupbox.file_comboboxes[idx2]
 
-                    sheets0 = self.jsd_model.data_sources[cbox0.currentData()].sheets
-                    sheets1 = self.jsd_model.data_sources[cbox1.currentData()].sheets
-
                     jsd_dict[(index1, idx2)] = {
-                        category: calculate_jsd(
-                            sheets0[category].df,
-                            sheets1[category].df,
-                            self.get_cols_to_use_for_jsd_calc(cbox0, category),
-                            calc_date,
-                        )
+                        category: self._get_spider_jsd(cbox0, cbox1, category, calc_date)
                         for category in categories
                     }
 
         return jsd_dict
 
+    def _get_spider_jsd(self, cbox0, cbox1, category, calc_date):
+        """
+        Get the JSD value between the files of two comboboxes for a category and date, reusing any earlier result.
+
+        Parameters:
+            cbox0 (QComboBox): The combobox of the first data file.
+            cbox1 (QComboBox): The combobox of the second data file.
+            category (str): The sheet category to compare.
+            calc_date: The date to use for the JSD calculation.
 
-def calculate_jsd(df1, df2, cols_to_use, calc_date):
+        Returns:
+            float: The Jensen-Shannon distance between the two data files.
+        """
+        file_name0 = cbox0.currentData()
+        file_name1 = cbox1.currentData()
+        key = (file_name0, file_name1, category, calc_date)
+        if key not in self._caches.spider_jsd:
+            self._caches.spider_jsd[key] = calculate_jsd(
+                self.jsd_model.data_sources[file_name0].sheets[category],
+                self.jsd_model.data_sources[file_name1].sheets[category],
+                self.get_cols_to_use_for_jsd_calc(cbox0, category),
+                calc_date,
+            )
+        return self._caches.spider_jsd[key]
+
+
+def calculate_jsd(sheet1, sheet2, cols_to_use, calc_date):
     """
-    Calculate the Jensen-Shannon distance between two dataframes for a given date.
+    Calculate the Jensen-Shannon distance between two data sheets for a given date.
 
     There is an assumption that the date column of the dataframes are sorted from smallest to largest.
 
     Note: The Jensen-Shannon distance returned is the square root of the Jensen-Shannon divergence.
 
     Parameters:
-    df1 (pd.DataFrame): First dataframe.
-    df2 (pd.DataFrame): Second dataframe.
+    sheet1 (DataSheet): First data sheet.
+    sheet2 (DataSheet): Second data sheet.
     cols_to_use (list): List of columns to use for the calculation.
     calc_date (pd.Timestamp): Date for which the calculation is performed.
 
     Returns:
-    float: Jensen-Shannon distance between the two dataframes.
+    float: Jensen-Shannon distance between the two data sheets.
     """
-    if df1.empty or df2.empty:
+    if sheet1.df.empty or sheet2.df.empty:
         return None
 
-    df1_row = df1.date.searchsorted(calc_date, side='right') - 1
-    df2_row = df2.date.searchsorted(calc_date, side='right') - 1
+    df1_row = sheet1.dates.searchsorted(calc_date, side='right') - 1
+    df2_row = sheet2.dates.searchsorted(calc_date, side='right') - 1
 
-    df1_data = df1[cols_to_use].iloc[df1_row].values.astype(float)
-    df2_data = df2[cols_to_use].iloc[df2_row].values.astype(float)
+    df1_data = sheet1.get_column_values(cols_to_use)[df1_row]
+    df2_data = sheet2.get_column_values(cols_to_use)[df2_row]
 
     return distance.jensenshannon(df1_data, df2_data, base=2.0)
 
 
-def remove_elements_less_than_from_sorted_list(sorted_list, value):
+def calculate_jsd_for_dates(sheet1, sheet2, cols_to_use, calc_dates):
+    """
+    Calculate the Jensen-Shannon distance between two data sheets for each of the given dates.
+
+    This gives the same values as calling calculate_jsd for each date, but the rows for all of the dates are looked up
+    at once and the distances are calculated in a single vectorized call.
+
+    There is an assumption that the date column of the dataframes are sorted from smallest to largest.
+
+    Parameters:
+    sheet1 (DataSheet): First data sheet.
+    sheet2 (DataSheet): Second data sheet.
+    cols_to_use (list): List of columns to use for the calculation.
+    calc_dates (array-like): Dates for which the calculation is performed.
+
+    Returns:
+    np.ndarray: Jensen-Shannon distances between the two data sheets, one for each date.
+    """
+    df1_rows = sheet1.dates.searchsorted(calc_dates, side='right') - 1
+    df2_rows = sheet2.dates.searchsorted(calc_dates, side='right') - 1
+
+    df1_data = sheet1.get_column_values(cols_to_use)[df1_rows]
+    df2_data = sheet2.get_column_values(cols_to_use)[df2_rows]
+
+    return distance.jensenshannon(df1_data, df2_data, base=2.0, axis=1)
+
+
+def calculate_jsd_timeline(sheet1, sheet2, cols_to_use):
     """
-    Remove elements less than the given value from a sorted list.
+    Calculate the Jensen-Shannon distance between two data sheets for every date in either sheet.
 
-    Args:
-        sorted_list (list): A sorted list of elements.
-        value: The value to compare against.
+    Both date columns are sorted, so they are merged and the dates from the later of the two start dates are kept.
+
+    Parameters:
+    sheet1 (DataSheet): First data sheet.
+    sheet2 (DataSheet): Second data sheet.
+    cols_to_use (list): List of columns to use for the calculation.
 
     Returns:
-        list: A new list containing only elements greater than or equal to the value.
+    tuple: The merged dates as a NumPy datetime64 array, and the Jensen-Shannon distances for each of the dates.
     """
-    # Find the index of the first element greater than or equal to the value
-    index = bisect_left(sorted_list, value)
+    first_date = max(sheet1.dates[0], sheet2.dates[0])
+    date_list = np.union1d(sheet1.dates, sheet2.dates)
+    date_list = date_list[date_list.searchsorted(first_date):]
 
-    # Slice the list to keep only elements greater than or equal to the value
-    return sorted_list[index:]
+    return date_list, calculate_jsd_for_dates(sheet1, sheet2, cols_to_use, date_list)
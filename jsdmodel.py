@@ -13,6 +13,8 @@
 #      limitations under the License.
 #
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, Optional
 
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
@@ -35,6 +37,7 @@ class JSDTableModel(QAbstractTableModel):
     Methods:
         __init__(self, data_source_list=None, custom_age_ranges=None): Initializes the JSDTableModel with the given data
             sources and custom age ranges.
+        load_data_sources(self, data_source_list): Loads several data sources in parallel and adds them in order.
         rowCount(self, parent: QModelIndex = None) -> int: Returns the number of rows in the model.
         columnCount(self, parent: QModelIndex = QModelIndex()) -> int: Returns the number of columns in the model.
         headerData(self, section: int, orientation: int, role: int, *args, **kwargs) -> Any: Returns the header data for
@@ -45,6 +48,7 @@ class JSDTableModel(QAbstractTableModel):
             index.
         flags(self, index: QModelIndex) -> Qt.ItemFlags: Returns the flags for the given index.
         add_color_mapping(self, color: str, mapping_area: Any): Adds a color mapping to the JSDTableModel.
+        notify_color_mapping_changed(self): Notifies the views that the background colors may have changed.
         clear_color_mapping(self): Clears the color mapping in the JSDTableModel.
 
     """
@@ -53,6 +57,7 @@ class JSDTableModel(QAbstractTableModel):
         "JSD",
     ]
     data_source_added = Signal()
+    MAX_LOAD_WORKERS = 8
 
     def __init__(self, data_source_list=None, custom_age_ranges=None):
         """
@@ -81,8 +86,29 @@ class JSDTableModel(QAbstractTableModel):
 
         if data_source_list is not None:
             self.data_sources = {}
-            for data_source_dict in data_source_list:
-                self.add_data_source(data_source_dict)
+            self.load_data_sources(data_source_list)
+
+    def load_data_sources(self, data_source_list):
+        """
+        Load several data sources in parallel and add them to the JSDTableModel.
+
+        Parsing the Excel files is mostly spent in pandas and openpyxl, so the files are loaded in a thread pool. The
+        data sources are then added in the order they are listed so that the data_sources dictionary keeps that order.
+
+        Args:
+            data_source_list (List[dict]): A list of data source dictionaries, see add_data_source.
+
+        Returns:
+            None
+        """
+        if not data_source_list:
+            return
+        max_workers = min(JSDTableModel.MAX_LOAD_WORKERS, len(data_source_list))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            data_sources = list(executor.map(partial(DataSource, custom_age_ranges=self.custom_age_ranges),
+                                             data_source_list))
+        for data_source in data_sources:
+            self._store_data_source(data_source)
 
     def add_data_source(self, data_source_dict):
         """
@@ -103,7 +129,19 @@ class JSDTableModel(QAbstractTableModel):
         Returns:
             None
         """
-        self.data_sources[data_source_dict['name']] = DataSource(data_source_dict, self.custom_age_ranges)
+        self._store_data_source(DataSource(data_source_dict, self.custom_age_ranges))
+
+    def _store_data_source(self, data_source: DataSource):
+        """
+        Store a loaded data source by name and emit the data_source_added signal.
+
+        Args:
+            data_source (DataSource): The loaded data source.
+
+        Returns:
+            None
+        """
+        self.data_sources[data_source.name] = data_source
         self.data_source_added.emit()
 
     def rowCount(self, parent: QModelIndex = None) -> int:
@@ -130,7 +168,8 @@ class JSDTableModel(QAbstractTableModel):
 
         This method updates the input data and column information in the JSDTableModel. It clears the existing input
         data and column information, and then sets them to the new values provided as arguments. It also updates the
-        maximum row count based on the new input data.
+        maximum row count based on the new input data. The number of rows and columns may change, so the update is
+        wrapped in a model reset.
 
         Args:
             new_input_data (List[List[Any]]): The new input data to be set in the model. It should be a list of lists,
@@ -142,6 +181,7 @@ class JSDTableModel(QAbstractTableModel):
         Returns:
             None
         """
+        self.beginResetModel()
         self._input_data.clear()
         self._column_infos.clear()
 
@@ -152,6 +192,7 @@ class JSDTableModel(QAbstractTableModel):
         self.max_row_count = 0
         for c in range(self.columnCount()):
             self.max_row_count = max(self.max_row_count, len(self._input_data[c]))
+        self.endResetModel()
 
     def columnCount(self, _parent: QModelIndex = None) -> int:
         """
@@ -295,6 +336,20 @@ class JSDTableModel(QAbstractTableModel):
         self._color_mapping.setdefault(color, [])
         self._color_mapping[color].append(mapping_area)
 
+    def notify_color_mapping_changed(self):
+        """
+        Notify the views that the background colors of the cells may have changed.
+
+        This emits the dataChanged signal for the background role of every cell, so it should be called once after the
+        color mappings have been updated rather than for each mapping.
+
+        Returns:
+            None
+        """
+        if self.max_row_count and self.columnCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.max_row_count - 1, self.columnCount() - 1),
+                                  [Qt.BackgroundRole])
+
     def clear_color_mapping(self):
         """
         Clear the color mapping in the JSDTableModel.
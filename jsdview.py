@@ -12,22 +12,23 @@
 #      See the License for the specific language governing permissions and
 #      limitations under the License.
 #
-import csv
 from functools import partial
-import io
 import math
 from typing import Iterable
+from weakref import WeakKeyDictionary
 
+import numpy as np
 from PySide6.QtCharts import (QAreaSeries, QCategoryAxis, QChart, QDateTimeAxis, QLineSeries, QPieSeries, QPolarChart,
                               QValueAxis)
-from PySide6.QtCore import (QDate, QDateTime, QEvent, QFileInfo, QObject, QPointF, QRect, Qt, QTime, Signal)
-from PySide6.QtGui import QAction, QGuiApplication, QKeySequence, QPainter
+from PySide6.QtCore import (QDateTime, QFileInfo, QRect, Qt, QTime, Signal)
+from PySide6.QtGui import QAction, QPainter
 from PySide6.QtWidgets import (QDialog, QDialogButtonBox, QDockWidget, QFileDialog, QFormLayout,
                                QHBoxLayout, QHeaderView, QLabel, QLayout, QLineEdit, QMainWindow, QMenu,
                                QMenuBar, QScrollArea, QSpinBox, QSplitter, QTableView, QVBoxLayout, QWidget)
 
+from copyabletableview import CopyableTableView
 from dataselectiongroupbox import JsdDataSelectionGroupBox
-from datetimetools import convert_date_to_milliseconds, numpy_datetime64_to_qdate
+from datetimetools import convert_dates_to_milliseconds, numpy_datetime64_array_to_qdates
 from grabbablewidget import GrabbableChartView
 
 
@@ -70,6 +71,9 @@ class JsdWindow(QMainWindow):
         self._dataselectiongroupbox = JsdDataSelectionGroupBox(data_sources)
 
         self.widgets = {}
+        self._file_options_dialog = None
+        # The area chart dates and percentages only depend on the sheet, which does not change once it is loaded
+        self._area_chart_data_cache = WeakKeyDictionary()
 
         self.table_view = CopyableTableView()
         self.addDockWidget(Qt.LeftDockWidgetArea,
@@ -92,6 +96,7 @@ class JsdWindow(QMainWindow):
 
         self.spider_chart = QPolarChart()
         self.area_chart_widget = QWidget()
+        self._area_chart_views = []
         # self.area_chart_layout = QVBoxLayout()
         self.area_chart_widget.setLayout(QVBoxLayout())
         self.spider_chart_vbox = QSplitter(Qt.Vertical)
@@ -443,71 +448,130 @@ class JsdWindow(QMainWindow):
         # Get the selected category
         category = self._dataselectiongroupbox.category_combobox.currentText()
 
-        # Clear any existing charts in the layout
-        clear_layout(self.area_chart_widget.layout())
+        # The chart views are reused between updates, so only remove the ones that are no longer needed
+        area_chart_views = self._area_chart_views
+        while len(area_chart_views) > len(sheet_dict):
+            area_chart_view = area_chart_views.pop()
+            self.area_chart_widget.layout().removeWidget(area_chart_view)
+            area_chart_view.deleteLater()
 
-        for index, sheets in sheet_dict.items():
+        for chart_num, (index, sheets) in enumerate(sheet_dict.items()):
             # Create a new QChart object for each sheet
             area_chart = QChart()
             filename = self.dataselectiongroupbox.file_comboboxes[index].currentData()
             area_chart.setTitle(f'{filename} {category} distribution over time')
 
             # Extract data from the sheet
-            df = sheets[category].df
-            cols_to_use = sheets[category].data_columns
-
-            # Prepare dates for the X-axis
-            dates = [QDateTime(numpy_datetime64_to_qdate(date), QTime()) for date in df.date.values]
+            sheet = sheets[category]
+            dates, cumulative_percents, keep_cols = self._get_area_chart_data(sheet)
 
-            JsdWindow._add_area_chart_series(area_chart, df, cols_to_use, dates)
+            JsdWindow._add_area_chart_series(area_chart, sheet.data_columns, dates, cumulative_percents, keep_cols)
             JsdWindow._attach_axes_to_area_chart(area_chart, dates)
 
-            # Add the configured chart to the display
-            self.add_area_chart_view(area_chart)
+            self._show_area_chart(chart_num, area_chart)
 
         return True
 
+    def _get_area_chart_data(self, sheet):
+        """
+        Get the data needed to draw the area chart of a sheet, computing it the first time the sheet is drawn.
+
+        Parameters:
+            sheet (DataSheet): The sheet to get the area chart data for.
+
+        Returns:
+            tuple: The dates as a list of QDateTime objects, the cumulative percentages from
+                   _calculate_cumulative_percents, and the positions of the data columns to add a series for.
+        """
+        area_chart_data = self._area_chart_data_cache.get(sheet)
+        if area_chart_data is None:
+            # Prepare dates for the X-axis
+            dates = [QDateTime(date, QTime()) for date in numpy_datetime64_array_to_qdates(sheet.dates)]
+            # The sheet keeps the data columns as an array, everything else is computed from it
+            values = sheet.get_column_values(sheet.data_columns)
+            # Skip columns with no data
+            keep_cols = np.flatnonzero(values[-1] != 0)
+            area_chart_data = (dates, JsdWindow._calculate_cumulative_percents(values), keep_cols)
+            self._area_chart_data_cache[sheet] = area_chart_data
+        return area_chart_data
+
+    def _show_area_chart(self, chart_num, area_chart):
+        """
+        Show an area chart in an existing area chart view, or add a new view for it.
+
+        Parameters:
+            chart_num (int): The position of the chart among the area charts.
+            area_chart (QChart): The configured area chart to show.
+
+        Returns:
+            None
+        """
+        area_chart_views = self._area_chart_views
+        if chart_num < len(area_chart_views):
+            old_chart = area_chart_views[chart_num].chart()
+            area_chart_views[chart_num].setChart(area_chart)
+            old_chart.deleteLater()
+        else:
+            area_chart_views.append(self.add_area_chart_view(area_chart))
+
     @staticmethod
-    def _add_area_chart_series(area_chart, df, cols_to_use, dates):
+    def _add_area_chart_series(area_chart, cols_to_use, dates, cumulative_percents, keep_cols):
         """
         Adds multiple series to the given area chart.
 
         Parameters:
             area_chart (QChart): The area chart to add the series to.
-            df (DataFrame): The DataFrame containing the data for the series.
             cols_to_use (list): A list of column names to use for the series.
             dates (list): A list of QDateTime objects representing the dates for the X-axis.
+            cumulative_percents (np.ndarray): The cumulative percentages from _calculate_cumulative_percents.
+            keep_cols (np.ndarray): The positions in cols_to_use of the columns to add a series for.
 
         Returns:
             None
         """
-        # Calculate cumulative percentages
-        total_counts = df[cols_to_use].sum(axis=1)
-        cumulative_percents = 100.0 * df[cols_to_use].cumsum(axis=1).div(total_counts, axis=0)
+        # Skip dates where the total is zero since they have no percentages
+        valid_rows = np.flatnonzero(np.isfinite(cumulative_percents[:, -1]))
+        time_points = np.array([dates[i].toMSecsSinceEpoch() for i in valid_rows], dtype=np.float64)
+        if len(time_points) == 1:
+            # A single date is drawn one millisecond wide so that the area is still visible
+            time_points = np.append(time_points, time_points[0] + 1)
+            valid_rows = np.repeat(valid_rows, 2)
 
         # Create series for the area chart
         lower_series = None
-        for col in cols_to_use:
-            if df[col].iloc[-1] == 0:  # Skip columns with no data
-                continue
-
-            # Generate data points for the series
-            points = [QPointF(dates[i].toMSecsSinceEpoch(), cumulative_percents.iloc[i][col]) for i in
-                      range(len(dates))]
-            if len(dates) == 1:
-                points.append(QPointF(dates[0].toMSecsSinceEpoch() + 1, cumulative_percents.iloc[0][col]))
-
+        for c in keep_cols:
+            # Add the data points for the whole column at once
             upper_series = QLineSeries(area_chart)
-            upper_series.append(points)
+            upper_series.appendNp(time_points, cumulative_percents[valid_rows, c])
 
             # Create the area series using the current and previous series
             area_series = QAreaSeries(upper_series, lower_series)
-            area_series.setName(col)
+            area_series.setName(cols_to_use[c])
             area_chart.addSeries(area_series)
 
             # Update the lower series for the next iteration
             lower_series = upper_series
 
+    @staticmethod
+    def _calculate_cumulative_percents(values):
+        """
+        Calculates the cumulative percentage of the total for each column, row by row.
+
+        The running sum across the columns is computed once, and its last column is the row total, so no separate
+        sum or intermediate DataFrames are needed.
+
+        Parameters:
+            values (np.ndarray): A 2D array of counts with one row per date and one column per data column, in stacking
+                                 order.
+
+        Returns:
+            np.ndarray: A 2D array of cumulative percentages with the same shape as values.
+        """
+        cumulative_percents = np.cumsum(values, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cumulative_percents *= 100.0 / cumulative_percents[:, -1:]
+        return cumulative_percents
+
     @staticmethod
     def _attach_axes_to_area_chart(area_chart, dates):
         """
@@ -554,55 +618,92 @@ class JsdWindow(QMainWindow):
         This method updates the table view model with the provided JSD model, effectively updating the JSD timeline plot
         """
         self.table_view.setModel(jsd_model)
-        self.jsd_timeline_chart.removeAllSeries()
         jsd_model.clear_color_mapping()
-        series_list = []
+        chart = self.jsd_timeline_chart
+        axis_x, axis_y = self._get_jsd_timeline_axes()
         date_min = math.inf
         date_max = -math.inf
 
+        # The series and axes are kept between updates and only their points are replaced, the extra series are removed
+        series_list = chart.series()
+        for series in series_list[len(jsd_model.column_infos):]:
+            chart.removeSeries(series)
+            series.deleteLater()
+
         # Use every other column since there are dates in every other column
         for c, column_info in enumerate(jsd_model.column_infos):
             col = c * 2
-            series = QLineSeries()
+            if c < len(series_list):
+                series = series_list[c]
+            else:
+                series = QLineSeries()
+                chart.addSeries(series)
+                series.attachAxis(axis_x)
+                series.attachAxis(axis_y)
             series.setName(f"{column_info['file1']} vs "
                            f"{column_info['file2']} "
                            f"{column_info['category']} JSD")
             row_count = jsd_model.rowCount(jsd_model.createIndex(0, col))
-            for i in range(row_count):
-                time_point = convert_date_to_milliseconds(jsd_model.input_data[col][i])
-                if time_point is not None:
-                    series.append(time_point, jsd_model.input_data[col + 1][i])
-                    if i == 0 and time_point < date_min:
-                        date_min = time_point
-                    if i == row_count - 1 and time_point > date_max:
-                        date_max = time_point
-            series_list.append(series)
-            self.jsd_timeline_chart.addSeries(series)
+            date_min, date_max = JsdWindow._replace_jsd_series_points(series, jsd_model.input_data[col],
+                                                                      jsd_model.input_data[col + 1], date_min, date_max)
             jsd_model.add_color_mapping(series.pen().color().name(), QRect(col, 0, 2, row_count))
 
-        self.jsd_timeline_chart.removeAxis(self.jsd_timeline_chart.axisX())
+        axis_x.setRange(QDateTime.fromMSecsSinceEpoch(date_min), QDateTime.fromMSecsSinceEpoch(date_max))
+
+        self.jsd_timeline_chart_view.setChart(self.jsd_timeline_chart)
+
+        return True
+
+    @staticmethod
+    def _replace_jsd_series_points(series, dates, jsd_values, date_min, date_max):
+        """
+        Replace the points of a JSD timeline series and widen the date range to include its dates.
+
+        Parameters:
+            series (QLineSeries): The series to replace the points of.
+            dates (list): The QDate objects for the points, dates that are None are skipped.
+            jsd_values (list): The JSD values for the points.
+            date_min (float): The earliest date found so far, in milliseconds since the epoch.
+            date_max (float): The latest date found so far, in milliseconds since the epoch.
+
+        Returns:
+            tuple: The updated earliest and latest dates, in milliseconds since the epoch.
+        """
+        jsd_values = np.asarray(jsd_values, dtype=np.float64)
+        time_points = convert_dates_to_milliseconds(dates[:len(jsd_values)])
+        valid_rows = np.flatnonzero(~np.isnan(time_points))
+        series.replaceNp(time_points[valid_rows], jsd_values[valid_rows])
+
+        # The dates are sorted, so only the first and last dates of each column are needed for the axis range
+        if valid_rows.size:
+            date_min = min(date_min, int(time_points[valid_rows[0]]))
+            date_max = max(date_max, int(time_points[valid_rows[-1]]))
+        return date_min, date_max
+
+    def _get_jsd_timeline_axes(self):
+        """
+        Get the date and JSD value axes of the JSD timeline chart, adding them to the chart the first time.
+
+        Returns:
+            tuple: The date axis (QDateTimeAxis) and the JSD value axis (QValueAxis).
+        """
+        horizontal_axes = self.jsd_timeline_chart.axes(Qt.Horizontal)
+        if horizontal_axes:
+            return horizontal_axes[0], self.jsd_timeline_chart.axes(Qt.Vertical)[0]
+
         axis_x = QDateTimeAxis()
         axis_x.setTickCount(10)
         axis_x.setFormat("MMM yyyy")
         axis_x.setTitleText("Date")
         self.jsd_timeline_chart.addAxis(axis_x, Qt.AlignBottom)
 
-        axis_y = self.jsd_timeline_chart.axisY()
-        if axis_y is None:
-            axis_y = QValueAxis()
-            axis_y.setTitleText("JSD value")
-            axis_y.setRange(0, 1)
-            axis_y.setTickCount(11)
-            self.jsd_timeline_chart.addAxis(axis_y, Qt.AlignLeft)
-
-        for series in series_list:
-            series.attachAxis(axis_x)
-            series.attachAxis(axis_y)
-        axis_x.setRange(QDateTime.fromMSecsSinceEpoch(date_min), QDateTime.fromMSecsSinceEpoch(date_max))
-
-        self.jsd_timeline_chart_view.setChart(self.jsd_timeline_chart)
+        axis_y = QValueAxis()
+        axis_y.setTitleText("JSD value")
+        axis_y.setRange(0, 1)
+        axis_y.setTickCount(11)
+        self.jsd_timeline_chart.addAxis(axis_y, Qt.AlignLeft)
 
-        return True
+        return axis_x, axis_y
 
     def set_animation_options(self, enable_animations: bool):
         """
@@ -637,7 +738,12 @@ class JsdWindow(QMainWindow):
         - None
         """
         file_name, _ = QFileDialog.getOpenFileName(self, "Open Excel File", "", "Excel Files (*.xls *.xlsx)")
-        file_options_dialog = FileOptionsDialog(self, file_name)
+        # The options dialog is created the first time it is needed and reused for every file after that
+        if self._file_options_dialog is None:
+            self._file_options_dialog = FileOptionsDialog(self, file_name)
+        else:
+            self._file_options_dialog.reset(file_name)
+        file_options_dialog = self._file_options_dialog
         file_options_dialog.exec()
         data_source_dict = {'name': file_options_dialog.name_line_edit.text(),
                             'description': file_options_dialog.description_line_edit.text(),
@@ -678,8 +784,8 @@ class JsdWindow(QMainWindow):
         f_l.addRow(QLabel("Number of Files to Compare:"), spinbox)
 
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(d.accept)
-        button_box.rejected.connect(d.reject)
+        button_box.accepted.connect(d.accept, Qt.DirectConnection)
+        button_box.rejected.connect(d.reject, Qt.DirectConnection)
         d.layout().addWidget(button_box)
 
         d.resize(400, -1)
@@ -783,6 +889,7 @@ class FileOptionsDialog (QDialog):
 
     Methods:
         __init__(self, parent, file_name: str): Initializes the FileOptionsDialog object.
+        reset(self, file_name: str): Resets the dialog fields for a new file.
     """
     def __init__(self, parent, file_name: str):
         """
@@ -800,8 +907,6 @@ class FileOptionsDialog (QDialog):
         """
         super().__init__(parent)
 
-        self.setLayout(QVBoxLayout())
-
         self.name_line_edit = QLineEdit()
         self.description_line_edit = QLineEdit()
         self.remove_column_text_line_edit = QLineEdit()
@@ -811,75 +916,31 @@ class FileOptionsDialog (QDialog):
         form_layout.addRow("Description (Drop-Down Menu)", self.description_line_edit)
         form_layout.addRow("Remove Column Text", self.remove_column_text_line_edit)
 
-        self.layout().addLayout(form_layout)
-
-        fi = QFileInfo(file_name)
-        self.setWindowTitle(fi.fileName())
-        self.name_line_edit.setText(fi.baseName())
-        self.description_line_edit.setText(fi.baseName())
-
         button_box = QDialogButtonBox(QDialogButtonBox.Ok)
-        button_box.accepted.connect(self.accept)
-        self.layout().addWidget(button_box)
+        button_box.accepted.connect(self.accept, Qt.DirectConnection)
 
-        self.resize(600, -1)
-
-
-class CopyableTableView(QTableView):
-    """
-    A custom subclass of QTableView that allows copying selected data to the clipboard.
+        # Build the whole layout first and attach it to the dialog once
+        layout = QVBoxLayout()
+        layout.addLayout(form_layout)
+        layout.addWidget(button_box)
+        self.setLayout(layout)
 
-    Methods:
-        __init__(): Initializes the CopyableTableView object.
-        eventFilter(source, event): Filters and handles key press events.
-        copy_selection(): Copies the selected data to the clipboard.
+        self.reset(file_name)
 
-    """
-    def __init__(self):
-        super().__init__()
-        self.installEventFilter(self)
+        self.resize(600, -1)
 
-    def eventFilter(self, source: QObject, event):
+    def reset(self, file_name: str):
         """
-        Filters and handles key press events.
+        Reset the dialog fields for a new file so that the dialog can be reused.
 
         Parameters:
-            source (object): The source object that triggered the event.
-            event (QEvent): The event object that contains information about the key press event.
-
-        Returns:
-            bool: True if the event is handled, False otherwise.
-        """
-        if event.type() == QEvent.KeyPress:
-            if event == QKeySequence.Copy:
-                self.copy_selection()
-                return True
-        return super(QTableView, self).eventFilter(source, event)
-
-    def copy_selection(self):
-        """
-        Copies the selected data to the clipboard as a tab-delimited table.
+        file_name: The name of the file for which the options are being displayed.
 
         Returns:
-            None
-
-        Raises:
-            None
+        None
         """
-        selection = self.selectedIndexes()
-        if selection:
-            rows = sorted(index.row() for index in selection)
-            columns = sorted(index.column() for index in selection)
-            rowcount = rows[-1] - rows[0] + 1
-            colcount = columns[-1] - columns[0] + 1
-            table = [[''] * colcount for _ in range(rowcount)]
-            for index in selection:
-                row = index.row() - rows[0]
-                column = index.column() - columns[0]
-                index_data = index.data()
-                if isinstance(index_data, QDate):
-                    index_data = index_data.toString(format=Qt.ISODate)
-                table[row][column] = index_data
-            stream = io.StringIO()
-            csv.writer(stream, delimiter='\t').writerows(table)
-            QGuiApplication.clipboard().setText(stream.getvalue())
+        fi = QFileInfo(file_name)
+        self.setWindowTitle(fi.fileName())
+        self.name_line_edit.setText(fi.baseName())
+        self.description_line_edit.setText(fi.baseName())
+        self.remove_column_text_line_edit.clear()
@@ -19,11 +19,6 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor, QFont, QPainter, QPixmap
 from PySide6.QtWidgets import QApplication, QSplashScreen
 
-from jsdconfig import JSDConfig
-from jsdcontroller import JSDController
-from jsdmodel import JSDTableModel
-from jsdview import JsdWindow
-
 
 class SplashScreen(QSplashScreen):
     """
@@ -94,6 +89,13 @@ def launch_diversity_calculator():
     splash.show()
     q_app.processEvents()
 
+    # The application modules pull in pandas, SciPy and QtCharts, so they are imported after the splash screen is shown
+    # pylint: disable=import-outside-toplevel
+    from jsdconfig import JSDConfig
+    from jsdcontroller import JSDController
+    from jsdmodel import JSDTableModel
+    from jsdview import JsdWindow
+
     config = JSDConfig()
     data_source_list = config.data['data sources']
     w = JsdWindow(data_source_list)  # Note: We should have the controller populate this once the tablemodel is loaded
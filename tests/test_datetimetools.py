@@ -3,7 +3,8 @@ import pandas as pd
 from PySide6.QtCore import QDate, QDateTime
 import pytest
 
-from datetimetools import convert_date_to_milliseconds, numpy_datetime64_to_qdate, pandas_date_to_qdate
+from datetimetools import (convert_date_to_milliseconds, convert_dates_to_milliseconds,
+                           numpy_datetime64_array_to_qdates, numpy_datetime64_to_qdate, pandas_date_to_qdate)
 
 
 class TestConvertDateToMilliseconds:
@@ -105,6 +106,32 @@ class TestConvertDateToMilliseconds:
         assert result == 253370764800000
 
 
+class TestConvertDatesToMilliseconds:
+
+    #  The function returns the same milliseconds since epoch as convert_date_to_milliseconds for each date.
+    def test_matches_single_date_conversion(self):
+        dates = [QDate(2022, 1, 1), QDate(1, 1, 1), QDate(9999, 12, 31), QDate(1969, 12, 31)]
+
+        result = convert_dates_to_milliseconds(dates)
+
+        assert result.tolist() == [convert_date_to_milliseconds(date) for date in dates]
+
+    #  The function returns NaN where a date is None.
+    def test_none_date_input(self):
+        dates = [QDate(2022, 1, 1), None]
+
+        result = convert_dates_to_milliseconds(dates)
+
+        assert result[0] == 1640995200000
+        assert np.isnan(result[1])
+
+    #  The function returns an empty array for an empty input.
+    def test_empty_input(self):
+        result = convert_dates_to_milliseconds([])
+
+        assert result.size == 0
+
+
 class TestPandasDateToQdate:
 
     #  Should convert a pandas Timestamp object to a QDate object with the same year, month, and day
@@ -247,3 +274,31 @@ class TestNumpyDatetime64ToQdate:
         result = numpy_datetime64_to_qdate(numpy_datetime)
 
         assert result == expected_qdate
+
+
+class TestNumpyDatetime64ArrayToQdates:
+
+    #  Should convert an array of numpy datetime64 values to a list of QDate objects
+    def test_convert_numpy_datetime_array_to_qdates(self):
+        numpy_datetimes = np.array(['2022-01-01', '2023-06-15'], dtype='datetime64[ns]')
+        expected_qdates = [QDate(2022, 1, 1), QDate(2023, 6, 15)]
+
+        result = numpy_datetime64_array_to_qdates(numpy_datetimes)
+
+        assert result == expected_qdates
+
+    #  Should match numpy_datetime64_to_qdate for each element, including times within the day
+    def test_matches_elementwise_conversion(self):
+        numpy_datetimes = pd.to_datetime(['2021-08-04 13:45', '2024-03-04 00:00', '1999-12-31 23:59']).values
+
+        result = numpy_datetime64_array_to_qdates(numpy_datetimes)
+
+        assert result == [numpy_datetime64_to_qdate(numpy_datetime) for numpy_datetime in numpy_datetimes]
+
+    #  Should return an empty list for an empty array
+    def test_empty_array(self):
+        numpy_datetimes = np.array([], dtype='datetime64[ns]')
+
+        result = numpy_datetime64_array_to_qdates(numpy_datetimes)
+
+        assert result == []
@@ -0,0 +1,57 @@
+import math
+import os
+
+import numpy as np
+import pytest
+
+from excel_layout import DataSource
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def sheet():
+    data_source = DataSource({'name': 'Test 1', 'data type': 'file',
+                              'filename': os.path.join(REPO_DIR, 'test_file_1.xlsx')})
+    return data_source.sheets['10']
+
+
+class TestGetColumnValues:
+
+    #  The values match the dataframe columns, in the order given.
+    def test_matches_dataframe_columns(self, sheet):
+        # Arrange
+        columns = ['3', '1', 'Not reported']
+
+        # Act
+        result = sheet.get_column_values(columns)
+
+        # Assert
+        np.testing.assert_array_equal(result, sheet.df[columns].to_numpy(dtype=float))
+
+    #  The cached values are shared between callers, so they cannot be modified.
+    def test_values_are_read_only(self, sheet):
+        # Act
+        result = sheet.get_column_values(['1', '2'])
+
+        # Assert
+        assert result is sheet.get_column_values(['1', '2'])
+        with pytest.raises(ValueError):
+            result[0, 0] = 0
+
+    #  Creating the custom age columns again rebuilds their values instead of returning stale cached values.
+    def test_custom_age_columns_rebuilt(self, sheet):
+        # Arrange
+        age_ranges = [[1, math.inf]]
+        columns = ['1-inf Custom', 'Not reported']
+        sheet.create_custom_age_columns(age_ranges)
+        old_values = sheet.get_column_values(columns)
+        sheet.df['5'] += 1000
+
+        # Act
+        sheet.create_custom_age_columns(age_ranges)
+        result = sheet.get_column_values(columns)
+
+        # Assert
+        np.testing.assert_array_equal(result[:, 0], old_values[:, 0] + 1000)
+        np.testing.assert_array_equal(result, sheet.df[columns].to_numpy(dtype=float))
@@ -0,0 +1,110 @@
+import math
+import os
+
+import numpy as np
+import pytest
+from scipy.spatial import distance
+
+from excel_layout import DataSource
+from jsdcontroller import calculate_jsd, calculate_jsd_for_dates
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_test_data_source(name, filename):
+    return DataSource({'name': name, 'data type': 'file', 'filename': os.path.join(REPO_DIR, filename)})
+
+
+@pytest.fixture(scope='module')
+def data_sources():
+    return load_test_data_source('Test 1', 'test_file_1.xlsx'), load_test_data_source('Test 2', 'test_file_2.xlsx')
+
+
+def get_calc_dates(sheet1, sheet2):
+    # The merged dates from the later of the two start dates, as used for the JSD timeline, along with a date halfway
+    # between each pair of neighbouring dates
+    first_date = max(sheet1.dates[0], sheet2.dates[0])
+    dates = np.union1d(sheet1.dates, sheet2.dates)
+    dates = dates[dates.searchsorted(first_date):]
+    midpoints = dates[:-1] + (dates[1:] - dates[:-1]) // 2
+    return np.union1d(dates, midpoints)
+
+
+class TestCalculateJsd:
+
+    #  The distance matches one calculated directly from the latest dataframe rows on or before the date.
+    def test_matches_dataframe_rows(self, data_sources):
+        # Arrange
+        sheet1 = data_sources[0].sheets['BB']
+        sheet2 = data_sources[1].sheets['BB']
+        cols_to_use = sheet1.data_columns
+
+        for calc_date in get_calc_dates(sheet1, sheet2):
+            # Act
+            result = calculate_jsd(sheet1, sheet2, cols_to_use, calc_date)
+
+            # Assert
+            df1_row = sheet1.df[sheet1.df['date'] <= calc_date].iloc[-1]
+            df2_row = sheet2.df[sheet2.df['date'] <= calc_date].iloc[-1]
+            expected = distance.jensenshannon(df1_row[cols_to_use].to_numpy(dtype=float),
+                                              df2_row[cols_to_use].to_numpy(dtype=float), base=2.0)
+            assert result == expected
+
+    #  Custom age columns created again on the sheets are used rather than stale cached values.
+    def test_uses_rebuilt_custom_age_columns(self):
+        # Arrange
+        sheet1 = load_test_data_source('Test 1', 'test_file_1.xlsx').sheets['10']
+        sheet2 = load_test_data_source('Test 2', 'test_file_2.xlsx').sheets['10']
+        age_ranges = [[1, math.inf]]
+        cols_to_use = ['1-inf Custom', 'Not reported']
+        calc_date = sheet1.dates[-1]
+        for sheet in (sheet1, sheet2):
+            sheet.create_custom_age_columns(age_ranges)
+        assert calculate_jsd(sheet1, sheet2, cols_to_use, calc_date) == 0.0
+        sheet1.df['Not reported'] = sheet1.df['1']
+
+        # Act
+        sheet1.create_custom_age_columns(age_ranges)
+        result = calculate_jsd(sheet1, sheet2, cols_to_use, calc_date)
+
+        # Assert
+        assert result > 0.0
+
+
+class TestCalculateJsdForDates:
+
+    #  The vectorized calculation gives the same values as calculating each date separately for every category.
+    def test_matches_calculate_jsd_for_each_date(self, data_sources):
+        # Arrange
+        data_source1, data_source2 = data_sources
+        categories = [category for category in data_source1.sheets if category in data_source2.sheets]
+        assert categories
+
+        for category in categories:
+            sheet1 = data_source1.sheets[category]
+            sheet2 = data_source2.sheets[category]
+            cols_to_use = sheet1.data_columns
+            calc_dates = get_calc_dates(sheet1, sheet2)
+
+            # Act
+            result = calculate_jsd_for_dates(sheet1, sheet2, cols_to_use, calc_dates)
+
+            # Assert
+            expected = [calculate_jsd(sheet1, sheet2, cols_to_use, calc_date) for calc_date in calc_dates]
+            assert result.tolist() == expected
+
+    #  A date between two sheet dates uses the rows for the most recent earlier dates.
+    def test_date_between_sheet_dates(self, data_sources):
+        # Arrange
+        sheet1 = data_sources[0].sheets['AA']
+        sheet2 = data_sources[1].sheets['AA']
+        cols_to_use = sheet1.data_columns
+        calc_date = sheet1.dates[1] + np.timedelta64(1, 'D')
+        assert not np.isin(calc_date, sheet1.dates) and not np.isin(calc_date, sheet2.dates)
+
+        # Act
+        result = calculate_jsd_for_dates(sheet1, sheet2, cols_to_use, [calc_date])
+
+        # Assert
+        assert result.tolist() == [calculate_jsd(sheet1, sheet2, cols_to_use, calc_date)]
+        assert result.tolist() == [calculate_jsd(sheet1, sheet2, cols_to_use, sheet1.dates[1])]
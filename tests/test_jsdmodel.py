@@ -0,0 +1,60 @@
+from PySide6.QtCore import QDate, Qt
+
+from jsdmodel import JSDTableModel
+
+
+def make_input_data(num_columns, num_rows):
+    return [[QDate(2020, 1, 1).addDays(row) for row in range(num_rows)] if col % 2 == 0 else [0.5] * num_rows
+            for col in range(num_columns)]
+
+
+class TestUpdateInputData:
+
+    #  Replacing the data resets the model, since the number of rows and columns can change.
+    def test_resets_model(self):
+        # Arrange
+        model = JSDTableModel()
+        model.update_input_data(make_input_data(12, 70), [{}] * 6)
+        signals = []
+        model.modelAboutToBeReset.connect(lambda: signals.append('about to reset'))
+        model.modelReset.connect(lambda: signals.append('reset'))
+        model.layoutChanged.connect(lambda: signals.append('layout changed'))
+
+        # Act
+        model.update_input_data(make_input_data(2, 3), [{}])
+
+        # Assert
+        assert signals == ['about to reset', 'reset']
+        assert model.columnCount() == 2
+        assert model.rowCount() == 3
+
+
+class TestNotifyColorMappingChanged:
+
+    #  The background role of every cell is reported as changed.
+    def test_emits_data_changed_for_all_cells(self):
+        # Arrange
+        model = JSDTableModel()
+        model.update_input_data(make_input_data(4, 5), [{}] * 2)
+        changes = []
+        model.dataChanged.connect(lambda top_left, bottom_right, roles: changes.append(
+            ((top_left.row(), top_left.column()), (bottom_right.row(), bottom_right.column()), list(roles))))
+
+        # Act
+        model.notify_color_mapping_changed()
+
+        # Assert
+        assert changes == [((0, 0), (4, 3), [Qt.BackgroundRole])]
+
+    #  Nothing is emitted for an empty model.
+    def test_empty_model(self):
+        # Arrange
+        model = JSDTableModel()
+        changes = []
+        model.dataChanged.connect(lambda *args: changes.append(args))
+
+        # Act
+        model.notify_color_mapping_changed()
+
+        # Assert
+        assert not changes
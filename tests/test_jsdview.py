@@ -0,0 +1,60 @@
+import csv
+import io
+import random
+
+import pytest
+
+from copyabletableview import CopyableTableView
+
+
+def write_with_csv_writer(rows):
+    stream = io.StringIO()
+    writer = csv.writer(stream, delimiter='\t')
+    writer.writerows(rows)
+    return stream.getvalue()
+
+
+def write_tab_delimited_rows(rows):
+    stream = io.StringIO()
+    CopyableTableView._write_tab_delimited_rows(stream, rows)
+    return stream.getvalue()
+
+
+class TestWriteTabDelimitedRows:
+
+    #  Rows of plain cells and rows with cells that need quoting are written the same way as csv.writer.
+    @pytest.mark.parametrize('rows', [
+        [['2021-08-04', '0.24789760629069252'], ['2021-08-20', '0.28149068914039704']],
+        [['a\tb', 'c']],
+        [['say "hi"', 'c']],
+        [['a\rb', 'c']],
+        [['a\nb', 'c']],
+        [['a\r\nb']],
+        [['']],
+        [['', '']],
+        [['', 'a'], [''], ['a', '']],
+        [[' ', ',', "'"]],
+        [],
+    ])
+    def test_matches_csv_writer(self, rows):
+        # Act
+        result = write_tab_delimited_rows(rows)
+
+        # Assert
+        assert result == write_with_csv_writer(rows)
+
+    #  Randomly generated rows are written the same way as csv.writer.
+    def test_matches_csv_writer_for_random_rows(self):
+        # Arrange
+        rng = random.Random(0)
+        pieces = ['', '', 'a', '1.5', ' ', ',', "'", '"', '\t', '\r', '\n', '2021-08-04']
+        rows = [[''.join(rng.choices(pieces, k=rng.randint(0, 3))) for _ in range(rng.randint(1, 4))]
+                for _ in range(5000)]
+
+        # Act
+        result = write_tab_delimited_rows(rows)
+
+        # Assert
+        assert result == write_with_csv_writer(rows)
+        for row in rows:
+            assert write_tab_delimited_rows([row]) == write_with_csv_writer([row])